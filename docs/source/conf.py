@@ -63,19 +63,15 @@ bibtex_bibfiles = ["refs.bib"]
 autodoc_member_order = "bysource"
 
 autodoc_mock_imports = [
-    "bokeh",
     "cloudpickle",
     "cyipopt",
     "fides",
     "joblib",
     "nlopt",
-    "pytest",
     "pygmo",
     "scipy",
     "sqlalchemy",
-    "tornado",
     "petsc4py",
-    "statsmodels",
     "numba",
 ]
 
@@ -141,7 +137,9 @@ else:
     todo_emit_warnings = True
 
 # -- Options for myst-nb  ----------------------------------------
-nb_execution_mode = "force"
+# Only re-execute notebooks whose code changed since the last build.
+nb_execution_mode = "cache"
+nb_execution_cache_path = "_build/.jupyter_cache"
 nb_execution_allow_errors = False
 nb_merge_streams = True
 
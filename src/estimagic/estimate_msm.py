@@ -55,7 +55,7 @@ from optimagic.parameters.tree_registry import get_registry
 from optimagic.shared.check_option_dicts import (
     check_optimization_options,
 )
-from optimagic.utilities import get_rng, to_pickle
+from optimagic.utilities import get_rng, robust_cholesky, to_pickle
 
 
 def estimate_msm(
@@ -309,15 +309,16 @@ def estimate_msm(
         x = converter.params_to_internal(estimates)
         int_jac = converter.derivative_to_internal(jacobian_eval, x)
     else:
+        registry = get_registry(extended=True)
 
         def func(x):
             params = converter.params_from_internal(x)
             sim_mom = simulate_moments(params, **simulate_moments_kwargs)
-            if isinstance(sim_mom, dict) and "simulated_moments" in sim_mom:
-                sim_mom = sim_mom["simulated_moments"]
-            registry = get_registry(extended=True)
-            out = np.array(tree_just_flatten(sim_mom, registry=registry))
-            return out
+            return _flatten_simulated_moments(sim_mom, registry)
+
+        # the moments at the estimates are already known; passing them as f0 saves one
+        # potentially expensive evaluation of simulate_moments
+        f0 = _flatten_simulated_moments(func_eval["contributions"], registry)
 
         int_jac = first_derivative(
             func=func,
@@ -326,6 +327,7 @@ def estimate_msm(
                 lower=internal_estimates.lower_bounds,
                 upper=internal_estimates.upper_bounds,
             ),
+            f0=f0,
             error_handling="continue",
             **asdict(jacobian_numdiff_options),
         ).derivative
@@ -413,10 +415,26 @@ def get_msm_optimization_functions(
         inner_tree=empirical_moments,
     )
 
-    chol_weights = np.linalg.cholesky(flat_weights)
+    # For diagonal weights (the default) the Cholesky factor is diagonal as well and
+    # the residuals can be calculated elementwise instead of with a matrix product.
+    # Negative weights are rejected by the positive semi-definiteness check below.
+    diagonal = np.diagonal(flat_weights)
+    is_diagonal = np.count_nonzero(flat_weights) == np.count_nonzero(diagonal)
+    if is_diagonal and np.all(diagonal >= 0):
+        chol_weights = np.sqrt(diagonal)
+    else:
+        # robust_cholesky also handles weighting matrices that are only positive
+        # semi-definite, e.g. because of perfectly correlated moments. It does not
+        # raise for indefinite matrices, so they are rejected explicitly.
+        eigenvalues = np.linalg.eigvalsh(flat_weights)
+        if eigenvalues.min() < -1e-10 * np.abs(eigenvalues).max():
+            raise np.linalg.LinAlgError(
+                "The weighting matrix must be positive semi-definite."
+            )
+        chol_weights = robust_cholesky(flat_weights)
 
     registry = get_registry(extended=True)
-    flat_emp_mom = tree_just_flatten(empirical_moments, registry=registry)
+    flat_emp_mom = np.array(tree_just_flatten(empirical_moments, registry=registry))
 
     _simulate_moments = _partial_kwargs(simulate_moments, simulate_moments_kwargs)
     _jacobian = _partial_kwargs(jacobian, jacobian_kwargs)
@@ -445,20 +463,35 @@ def _msm_criterion(
     params, simulate_moments, flat_empirical_moments, chol_weights, registry
 ):
     """Calculate msm criterion given parameters and building blocks."""
-    simulated = simulate_moments(params)
-    if isinstance(simulated, dict) and "simulated_moments" in simulated:
-        simulated = simulated["simulated_moments"]
-    if isinstance(simulated, np.ndarray) and simulated.ndim == 1:
-        simulated_flat = simulated
-    else:
-        simulated_flat = np.array(tree_just_flatten(simulated, registry=registry))
+    simulated_flat = _flatten_simulated_moments(simulate_moments(params), registry)
 
     deviations = simulated_flat - flat_empirical_moments
-    residuals = deviations @ chol_weights
+    if chol_weights.ndim == 1:
+        residuals = deviations * chol_weights
+    else:
+        residuals = deviations @ chol_weights
 
     return LeastSquaresFunctionValue(value=residuals)
 
 
+def _flatten_simulated_moments(simulated, registry):
+    """Flatten the output of simulate_moments into a 1d numpy array.
+
+    The common cases of 1d arrays and pandas Series are handled without going through
+    the pytree machinery because this runs in every criterion evaluation.
+
+    """
+    if isinstance(simulated, dict) and "simulated_moments" in simulated:
+        simulated = simulated["simulated_moments"]
+    if isinstance(simulated, np.ndarray) and simulated.ndim == 1:
+        out = simulated
+    elif isinstance(simulated, pd.Series):
+        out = simulated.to_numpy()
+    else:
+        out = np.array(tree_just_flatten(simulated, registry=registry))
+    return out
+
+
 def _partial_kwargs(func, kwargs):
     """Partial keyword arguments into a function.
 
@@ -565,6 +598,16 @@ class MomentsResult:
     def _p_values(self):
         return self.p_values()
 
+    @cached_property
+    def _optimal_weights_and_params_cov(self):
+        weights_opt = get_weighting_matrix(
+            moments_cov=self._internal_moments_cov,
+            method="optimal",
+            empirical_moments=self._empirical_moments,
+        )
+        params_cov_opt = cov_optimal(self._internal_jacobian, weights_opt)
+        return weights_opt, params_cov_opt
+
     def se(
         self,
         method="robust",
@@ -915,12 +958,7 @@ class MomentsResult:
             seed=seed,
         )
 
-        weights_opt = get_weighting_matrix(
-            moments_cov=moments_cov,
-            method="optimal",
-            empirical_moments=self._empirical_moments,
-        )
-        params_cov_opt = cov_optimal(jac, weights_opt)
+        weights_opt, params_cov_opt = self._optimal_weights_and_params_cov
 
         if kind == "bias":
             raw = calculate_sensitivity_to_bias(jac=jac, weights=weights)
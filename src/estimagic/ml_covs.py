@@ -2,6 +2,7 @@
 
 import numpy as np
 import pandas as pd
+import scipy.linalg
 
 from estimagic.shared_covs import process_pandas_arguments
 from optimagic.exceptions import INVALID_INFERENCE_MSG
@@ -31,7 +32,7 @@ def cov_hessian(hess):
     """
     _hess, names = process_pandas_arguments(hess=hess)
     info_matrix = -_hess
-    cov = robust_inverse(info_matrix, msg=INVALID_INFERENCE_MSG)
+    cov = _invert_information_matrix(info_matrix)
 
     if "params" in names:
         cov = pd.DataFrame(cov, columns=names["params"], index=names["params"])
@@ -55,7 +56,7 @@ def cov_jacobian(jac):
     _jac, names = process_pandas_arguments(jac=jac)
 
     info_matrix = _jac.T @ _jac
-    cov = robust_inverse(info_matrix, msg=INVALID_INFERENCE_MSG)
+    cov = _invert_information_matrix(info_matrix)
 
     if "params" in names:
         cov = pd.DataFrame(cov, columns=names["params"], index=names["params"])
@@ -84,9 +85,10 @@ def cov_robust(jac, hess):
     _jac, _hess, names = process_pandas_arguments(jac=jac, hess=hess)
 
     info_matrix_hess = -_hess
-    cov_hess = robust_inverse(info_matrix_hess, msg=INVALID_INFERENCE_MSG)
-
-    cov = cov_hess @ _jac.T @ _jac @ cov_hess
+    # jac.T @ jac is dispatched to a symmetric rank-k update (syrk) by numpy and is much
+    # cheaper than chaining cov_hess @ jac.T @ jac from the left
+    info_matrix_jac = _jac.T @ _jac
+    cov = _sandwich(info_matrix_hess, info_matrix_jac)
 
     if "params" in names:
         cov = pd.DataFrame(cov, columns=names["params"], index=names["params"])
@@ -178,6 +180,77 @@ def cov_strata_robust(jac, hess, design_info):
     return cov
 
 
+def _invert_information_matrix(info_matrix):
+    """Invert an information matrix using its Cholesky factor.
+
+    Information matrices are positive definite in well behaved problems, which makes
+    a Cholesky based inverse faster and more accurate than a general one. If no
+    Cholesky factor can be used, we fall back to robust_inverse.
+
+    Args:
+        info_matrix (np.array): 2d array of dimension (nparams, nparams).
+
+    Returns:
+        np.array: 2d array of dimension (nparams, nparams).
+
+    """
+    factor = _get_cholesky_factor(info_matrix)
+    if factor is None:
+        return robust_inverse(info_matrix, msg=INVALID_INFERENCE_MSG)
+    identity = np.eye(len(info_matrix))
+    return scipy.linalg.cho_solve(factor, identity, check_finite=False)
+
+
+def _get_cholesky_factor(info_matrix):
+    """Get the Cholesky factor of a symmetric positive definite information matrix.
+
+    The Cholesky factorization only reads the upper triangle, so None is returned if
+    the matrix is not symmetric relative to its scale. None is also returned if the
+    factorization fails.
+
+    Args:
+        info_matrix (np.array): 2d array of dimension (nparams, nparams).
+
+    Returns:
+        tuple or None: The output of scipy.linalg.cho_factor or None.
+
+    """
+    scale = np.abs(info_matrix).max()
+    if np.abs(info_matrix - info_matrix.T).max() > 1e-10 * scale:
+        return None
+    try:
+        factor = scipy.linalg.cho_factor(info_matrix, check_finite=False)
+    except np.linalg.LinAlgError:
+        factor = None
+    return factor
+
+
+def _sandwich(info_matrix, meat):
+    """Calculate inv(info_matrix) @ meat @ inv(info_matrix).
+
+    The information matrix is factorized once and the sandwich is calculated with two
+    Cholesky solves instead of an explicit inverse and two matrix products. If no
+    Cholesky factor can be used, we fall back to robust_inverse.
+
+    Args:
+        info_matrix (np.array): 2d array of dimension (nparams, nparams).
+        meat (np.array): Symmetric 2d array of dimension (nparams, nparams).
+
+    Returns:
+        np.array: 2d array of dimension (nparams, nparams).
+
+    """
+    factor = _get_cholesky_factor(info_matrix)
+    if factor is None:
+        inverse = robust_inverse(info_matrix, msg=INVALID_INFERENCE_MSG)
+        sandwich = inverse @ meat @ inverse
+    else:
+        left = scipy.linalg.cho_solve(factor, meat, check_finite=False)
+        sandwich = scipy.linalg.cho_solve(factor, left.T, check_finite=False).T
+    # remove the asymmetry that is introduced by rounding errors
+    return (sandwich + sandwich.T) / 2
+
+
 def _sandwich_step(hess, meat):
     """The sandwich estimator for variance estimation.
 
@@ -194,8 +267,8 @@ def _sandwich_step(hess, meat):
         var (np.array): 2d variance-covariance matrix
 
     """
-    invhessian = robust_inverse(hess, INVALID_INFERENCE_MSG)
-    var = np.dot(np.dot(invhessian, meat), invhessian)
+    # inv(hess) @ meat @ inv(hess) is equal to inv(-hess) @ meat @ inv(-hess)
+    var = _sandwich(-hess, meat)
     return var
 
 
@@ -216,13 +289,10 @@ def _clustering(jac, design_info):
             the likelihood equation (Pg.557, 14-10, Greene 7th edition)
 
     """
-    list_of_clusters = design_info["psu"].unique()
-    meat = np.zeros([len(jac[0, :]), len(jac[0, :])])
-    for psu in list_of_clusters:
-        psu_scores = jac[design_info["psu"] == psu]
-        psu_scores_sum = psu_scores.sum(axis=0)
-        meat += np.dot(psu_scores_sum[:, None], psu_scores_sum[:, None].T)
-    cluster_meat = len(list_of_clusters) / (len(list_of_clusters) - 1) * meat
+    psu_scores_sum = _sum_by_group(jac, design_info["psu"])
+    n_clusters = len(psu_scores_sum)
+    meat = psu_scores_sum.T @ psu_scores_sum
+    cluster_meat = n_clusters / (n_clusters - 1) * meat
     return cluster_meat
 
 
@@ -243,36 +313,51 @@ def _stratification(jac, design_info):
         the likelihood equation
 
     """
-    n_params = len(jac[0, :])
-    stratum_col = design_info["strata"]
+    stratum_col = design_info["strata"].to_numpy()
     # Stratification does not require clusters
-    if "psu" not in design_info:
-        design_info["psu"] = design_info.index
+    psu_col = design_info["psu"] if "psu" in design_info else design_info.index
+    psu_codes = pd.factorize(np.asarray(psu_col), use_na_sentinel=False)[0]
+    # psu_sums stacks the sum of the observations for each cluster.
+    psu_sums = _sum_by_group(jac, psu_codes)
+    # one row per combination of stratum and cluster
+    strata_psu = (
+        pd.DataFrame({"stratum": stratum_col, "psu": psu_codes})
+        .dropna(subset=["stratum"])
+        .drop_duplicates()
+    )
+    strata_codes, strata = pd.factorize(strata_psu["stratum"])
+    psu_jac = psu_sums[strata_psu["psu"].to_numpy()]
+    n_psu = np.bincount(strata_codes)[:, None]
+    if "fpc" in design_info:
+        fpc = design_info["fpc"].groupby(stratum_col, sort=False).first()
+        fpc = fpc.loc[strata].to_numpy()[:, None]
     else:
-        pass
-    psu_col = design_info["psu"]
-    strata_meat = np.zeros([n_params, n_params])
-    # Variance estimation per stratum
-    for stratum in stratum_col.unique():
-        psu_in_strata = psu_col[stratum_col == stratum].unique()
-        psu_jac = np.zeros([n_params])
-        if "fpc" in design_info:
-            fpc = design_info["fpc"][stratum_col == stratum].unique()
-        else:
-            fpc = 1
-        # psu_jac stacks the sum of the observations for each cluster.
-        for psu in psu_in_strata:
-            psu_jac = np.vstack([psu_jac, np.sum(jac[psu_col == psu], axis=0)])
-        psu_jac_mean = np.sum(psu_jac, axis=0) / len(psu_in_strata)
-        if len(psu_in_strata) > 1:
-            mid_step = np.dot(
-                (psu_jac[1:] - psu_jac_mean).T, (psu_jac[1:] - psu_jac_mean)
-            )
-            strata_meat += (
-                fpc * (len(psu_in_strata) / (len(psu_in_strata) - 1)) * mid_step
-            )
-        # Apply "grand-mean" method for single unit stratum
-        elif len(psu_in_strata) == 1:
-            strata_meat += fpc * np.dot(psu_jac[1:].T, psu_jac[1:])
+        fpc = np.ones_like(n_psu)
+
+    # Variance estimation for all strata at once. Strata with a single cluster use the
+    # "grand-mean" method, i.e. the cluster sums are not demeaned.
+    multi_psu = n_psu > 1
+    psu_jac_mean = _sum_by_group(psu_jac, strata_codes) / n_psu
+    deviations = psu_jac - np.where(multi_psu, psu_jac_mean, 0)[strata_codes]
+    weights = np.where(multi_psu, fpc * n_psu / np.maximum(n_psu - 1, 1), fpc)
+    strata_meat = (deviations * weights[strata_codes]).T @ deviations
 
     return strata_meat
+
+
+def _sum_by_group(jac, groups):
+    """Sum the rows of jac within each group.
+
+    Args:
+        jac (np.array): 2d array of dimension (nobs, nparams).
+        groups (pd.Series or np.array): Group label of each row of jac.
+
+    Returns:
+        np.array: 2d array of dimension (ngroups, nparams). The groups are ordered by
+            their first appearance in groups.
+
+    """
+    codes = pd.factorize(np.asarray(groups), use_na_sentinel=False)[0]
+    # codes are numbered by first appearance, so the sorted groupby keeps that order
+    group_sums = pd.DataFrame(jac).groupby(codes).sum().to_numpy()
+    return group_sums
@@ -63,23 +63,19 @@ def transform_covariance(
             cov=internal_cov,
             size=n_samples,
         )
-        transformed_free = []
-        for params in sample:
-            if bounds_handling == "clip":
-                x = np.clip(params, a_min=lower_bounds, a_max=upper_bounds)
-            elif bounds_handling == "raise":
-                if (params < lower_bounds).any() or (params > upper_bounds).any():
-                    raise ValueError()
-            else:
-                x = params
-
-            transformed = _from_internal(x=x, return_type="flat")
-            transformed_free.append(transformed[is_free])
-
-        free_cov = np.cov(
-            np.array(transformed_free),
-            rowvar=False,
-        )
+        # bounds are handled for all draws at once; only the conversion to external
+        # parameters has to be done draw by draw
+        if bounds_handling == "clip":
+            sample = np.clip(sample, a_min=lower_bounds, a_max=upper_bounds)
+        elif bounds_handling == "raise":
+            if (sample < lower_bounds).any() or (sample > upper_bounds).any():
+                raise ValueError()
+
+        transformed_free = np.empty((n_samples, is_free.sum()))
+        for i, x in enumerate(sample):
+            transformed_free[i] = _from_internal(x=x, return_type="flat")[is_free]
+
+        free_cov = np.cov(transformed_free, rowvar=False)
 
     else:
         free_cov = internal_cov
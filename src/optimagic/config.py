@@ -1,13 +1,13 @@
 from pathlib import Path
 
 import pandas as pd
-import plotly.express as px
+import plotly.colors
 from packaging import version
 
 DOCS_DIR = Path(__file__).parent.parent / "docs"
 
 PLOTLY_TEMPLATE = "simple_white"
-PLOTLY_PALETTE = px.colors.qualitative.Set2
+PLOTLY_PALETTE = plotly.colors.qualitative.Set2
 
 DEFAULT_N_CORES = 1
 
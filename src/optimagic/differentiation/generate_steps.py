@@ -110,8 +110,7 @@ def generate_steps(
             base_steps, pos, neg, lower_step_bounds, upper_step_bounds, min_steps
         )
 
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore", category=RuntimeWarning)
+    with np.errstate(invalid="ignore"):
         pos[pos > upper_step_bounds.reshape(-1, 1)] = np.nan
         neg[neg < lower_step_bounds.reshape(-1, 1)] = np.nan
 
@@ -1,8 +1,9 @@
 import io
+import pickle
 import warnings
 from abc import ABC, abstractmethod
-from dataclasses import asdict, fields, is_dataclass
-from typing import Any, Generic, Type, TypeVar
+from dataclasses import fields, is_dataclass
+from typing import Any, Generic, Sequence, Type, TypeVar
 
 import cloudpickle
 import pandas as pd
@@ -70,6 +71,19 @@ class _KeyValueStore(Generic[InputType, OutputType], ABC):
 
         """
 
+    def insert_many(self, values: Sequence[InputType]) -> None:
+        """Insert several values into the key-value store.
+
+        Subclasses should override this if they can insert all values at once, e.g. in
+        a single database transaction.
+
+        Args:
+            values: The values to insert, in order.
+
+        """
+        for value in values:
+            self.insert(value)
+
     @abstractmethod
     def _select_by_key(self, key: int) -> list[OutputType]:
         """Implement this method to select a value from the store by its primary key."""
@@ -106,6 +120,21 @@ class _KeyValueStore(Generic[InputType, OutputType], ABC):
 
         """
 
+    def max_key(self) -> int | None:
+        """Get the largest primary key in the store.
+
+        Subclasses should override this if they can look up the key without loading
+        the last row.
+
+        Returns:
+            The largest primary key or None if the store is empty.
+
+        """
+        last_rows = self.select_last_rows(1)
+        if not last_rows:
+            return None
+        return getattr(last_rows[0], self.primary_key)
+
     def to_df(self) -> pd.DataFrame:
         """Convert the store's data to a Pandas DataFrame.
 
@@ -114,7 +143,14 @@ class _KeyValueStore(Generic[InputType, OutputType], ABC):
 
         """
         items = self._select_all()
-        return pd.DataFrame([asdict(item) for item in items])
+        if not items:
+            return pd.DataFrame()
+        # Build the frame column by column from the item attributes. In contrast to
+        # dataclasses.asdict, this does not deep copy the values of each item.
+        columns = [field.name for field in fields(items[0])]
+        return pd.DataFrame(
+            {col: [getattr(item, col) for item in items] for col in columns}
+        )
 
 
 class UpdatableKeyValueStore(_KeyValueStore[InputType, OutputType], ABC):
@@ -176,21 +212,22 @@ class RobustPickler:
     ) -> Any:
         """Robust pickle loading.
 
-        We first try to unpickle the object with pd.read_pickle. This makes no
-        difference for non-pandas objects but makes the de-serialization
-        of pandas objects more robust across pandas versions. If that fails, we use
-        cloudpickle. If that fails, we return None but do not raise an error.
+        We first try a plain pickle.loads, which is the fastest option and works for
+        everything that was pickled with the installed package versions. If that fails,
+        we use pd.read_pickle, which makes the de-serialization of pandas objects more
+        robust across pandas versions. If that fails, we return None but do not raise
+        an error.
 
         See: https://github.com/pandas-dev/pandas/issues/16474
 
         """
         try:
-            res = pd.read_pickle(io.BytesIO(data), compression=None)
+            res = pickle.loads(data)
         except (KeyboardInterrupt, SystemExit):
             raise
         except Exception:
             try:
-                res = cloudpickle.loads(data)
+                res = pd.read_pickle(io.BytesIO(data), compression=None)
             except (KeyboardInterrupt, SystemExit):
                 raise
             except Exception:
@@ -115,16 +115,11 @@ class LogReader(Generic[_LogOptionsType], ABC):
         if iteration >= 0:
             rowid = iteration + 1
         else:
-            try:
-                last_row = self._iteration_store.select_last_rows(1)
-                highest_rowid = last_row[0].rowid
-            except IndexError as e:
-                raise IndexError(
-                    "Invalid iteration request, iteration store is empty"
-                ) from e
+            highest_rowid = self._iteration_store.max_key()
+            if highest_rowid is None:
+                raise IndexError("Invalid iteration request, iteration store is empty")
 
             # iteration is negative here!
-            assert highest_rowid is not None
             rowid = highest_rowid + iteration + 1
 
         row_list = self._iteration_store.select(rowid)
@@ -187,9 +182,9 @@ class LogReader(Generic[_LogOptionsType], ABC):
 
         times = np.array(history["time"])
         times -= times[0]
-        history["time"] = times.tolist()
 
-        df = pd.DataFrame(history)
+        # pass the array directly to avoid a round trip through a Python list
+        df = pd.DataFrame({**history, "time": times})
         df = df.merge(
             steps[[f"{self._step_store.primary_key}", "type"]],
             left_on="step",
@@ -407,7 +402,8 @@ class SQLiteLogOptions(SQLAlchemyConfig, LogOptions):
 
         The other function speeds up the write process. If fast_logging is False, it
         does so using only completely safe optimizations. Of fast_logging is True,
-        it also uses unsafe optimizations.
+        it also uses unsafe optimizations. It also memory maps the database and
+        enlarges the page cache to speed up reading.
 
         """
 
@@ -419,8 +415,10 @@ class SQLiteLogOptions(SQLAlchemyConfig, LogOptions):
 
         @sql.event.listens_for(engine, "begin")
         def do_begin(conn: Any) -> None:
-            # emit our own BEGIN
-            conn.exec_driver_sql("BEGIN DEFERRED")
+            # emit our own BEGIN; single read statements are atomic on their own and
+            # run in SQLite's autocommit mode instead
+            if not conn.get_execution_options().get("read_only", False):
+                conn.exec_driver_sql("BEGIN DEFERRED")
 
         @sql.event.listens_for(engine, "connect")
         def set_sqlite_pragma(dbapi_connection: Any, connection_record: Any) -> None:  # noqa: ARG001
@@ -430,6 +428,17 @@ class SQLiteLogOptions(SQLAlchemyConfig, LogOptions):
                 cursor.execute("PRAGMA synchronous = OFF")
             else:
                 cursor.execute("PRAGMA synchronous = NORMAL")
+            # read pages through a memory map and keep a larger page cache such that
+            # repeated reads of the history do not hit the file system
+            cursor.execute("PRAGMA mmap_size = 268435456")
+            cursor.execute("PRAGMA cache_size = -65536")
+            cursor.execute("PRAGMA temp_store = MEMORY")
+            # wait for concurrent writers, e.g. parallel optimizations, instead of
+            # failing with "database is locked"
+            cursor.execute("PRAGMA busy_timeout = 30000")
+            # refresh the query planner statistics if they are outdated; this is what
+            # the SQLite documentation recommends when a connection is opened
+            cursor.execute("PRAGMA optimize = 0x10002")
             cursor.close()
 
 
@@ -495,8 +504,12 @@ class _SQLiteLogStore(LogStore[SQLiteLogOptions, SQLiteLogReader]):
                     f"ExistenceStrategy.EXTEND."
                 )
             elif if_database_exists is ExistenceStrategy.REPLACE:
+                # In WAL mode, a leftover -wal file would be replayed into the new
+                # database, so the sidecar files are removed together with it.
                 try:
-                    os.remove(path)
+                    for file in (path, f"{path}-wal", f"{path}-shm"):
+                        if os.path.exists(file):
+                            os.remove(file)
                 except PermissionError as e:
                     msg = (
                         f"Failed to remove file {path}. "
@@ -510,6 +523,9 @@ class _SQLiteLogStore(LogStore[SQLiteLogOptions, SQLiteLogReader]):
     @classmethod
     def create(cls, log_options: SQLiteLogOptions) -> _SQLiteLogStore:
         cls._handle_existing_database(log_options.path, log_options.if_database_exists)
+        if log_options.if_database_exists is ExistenceStrategy.REPLACE:
+            # pooled connections of the shared engine may point to the removed file
+            log_options.engine.dispose()
 
         iteration_store = IterationStore(log_options)
         step_store = StepStore(log_options)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import traceback
 import warnings
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, fields
 from functools import cached_property
 from typing import Any, Sequence, Type, cast
 
@@ -32,8 +32,8 @@ from optimagic.logging.types import (
 class SQLAlchemyConfig:
     """Configuration class for setting up an SQLAlchemy engine and metadata.
 
-    This class manages the connection URL, engine creation, and metadata reflection
-    for an SQLAlchemy database connection.
+    This class manages the connection URL, engine creation, and metadata for an
+    SQLAlchemy database connection.
 
     Args:
         url: The database URL to connect to.
@@ -50,15 +50,32 @@ class SQLAlchemyConfig:
     def metadata(self) -> MetaData:
         """Get the metadata object.
 
+        Tables are reflected into it on demand by the stores that use them, so
+        unrelated tables in the same database are never reflected.
+
         Returns:
-            The SQLAlchemy MetaData object reflecting the database schema.
+            The SQLAlchemy MetaData object shared by all stores of this database.
 
         """
-        engine = self.create_engine()
-        metadata = MetaData()
         self._configure_reflect()
-        metadata.reflect(engine)
-        return metadata
+        return MetaData()
+
+    @cached_property
+    def engine(self) -> Engine:
+        """Get the engine that is shared by all stores using this configuration.
+
+        Returns:
+            An SQLAlchemy Engine object.
+
+        """
+        return self.create_engine()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Engines hold connection pools and locks and cannot be pickled. They are
+        # recreated lazily after unpickling.
+        state = self.__dict__.copy()
+        state.pop("engine", None)
+        return state
 
     def create_engine(self) -> Engine:
         """Create and return an SQLAlchemy engine.
@@ -75,14 +92,20 @@ class SQLAlchemyConfig:
 
         Code ist taken from the documentation: https://tinyurl.com/y7q287jr
 
+        The listener is global, so it is only registered once.
+
         """
+        if not sql.event.contains(sql.Table, "column_reflect", _setup_pickletype):
+            sql.event.listen(sql.Table, "column_reflect", _setup_pickletype)
+
 
-        @sql.event.listens_for(sql.Table, "column_reflect")
-        def _setup_pickletype(
-            inspector: Any, table: sql.Table, column_info: dict[str, Any]
-        ) -> None:  # noqa: ARG001
-            if isinstance(column_info["type"], sql.BLOB):
-                column_info["type"] = sql.PickleType(pickler=RobustPickler)  # type:ignore
+def _setup_pickletype(
+    inspector: Any,  # noqa: ARG001
+    table: sql.Table,  # noqa: ARG001
+    column_info: dict[str, Any],
+) -> None:
+    if isinstance(column_info["type"], sql.BLOB):
+        column_info["type"] = sql.PickleType(pickler=RobustPickler)  # type:ignore
 
 
 @dataclass
@@ -118,11 +141,14 @@ class TableConfig:
             The SQLAlchemy Table object representing the created or reflected table.
 
         """
-        metadata.reflect(engine)
+        # Only this table is reflected; reflecting the whole database costs one round
+        # of schema queries per table, including tables optimagic does not use.
+        if self.table_name not in metadata.tables:
+            metadata.reflect(engine, only=lambda name, _: name == self.table_name)
         table = sql.Table(
             self.table_name, metadata, *self.columns, extend_existing=True
         )
-        metadata.create_all(engine)
+        metadata.create_all(engine, tables=[table])
         return table
 
 
@@ -140,9 +166,23 @@ class _SQLAlchemyStoreMixin:
 
     def __init__(self, db_config: SQLAlchemyConfig, table_config: TableConfig):
         self._db_config = db_config
-        self._engine = db_config.create_engine()
+        self._engine = db_config.engine
         self._table_config = table_config
         self._table = table_config.create_table(db_config.metadata, self._engine)
+        # The statements only differ in their parameters, so they are built once and
+        # the parameters are bound at execution time.
+        key_column = getattr(self._table.c, table_config.primary_key)
+        self._select_by_key_stmt = self._table.select().where(
+            key_column == sql.bindparam("key")
+        )
+        self._select_all_stmt = self._table.select()
+        self._select_last_rows_stmt = (
+            self._table.select()
+            .order_by(key_column.desc())
+            .limit(sql.bindparam("n_rows"))
+        )
+        self._select_max_key_stmt = sql.select(sql.func.max(key_column))
+        self._insert_stmt = self._table.insert()
 
     @property
     def column_names(self) -> list[str]:
@@ -161,36 +201,43 @@ class _SQLAlchemyStoreMixin:
         return self._engine
 
     def _select_row_by_key(self, key: int) -> list[Any]:
-        stmt = self._table.select().where(
-            getattr(self._table.c, self._table_config.primary_key) == key
-        )
-        return self._execute_read_statement(stmt)
+        return self._execute_read_statement(self._select_by_key_stmt, {"key": key})
 
     def _select_all_rows(self) -> list[Any]:
-        stmt = self._table.select()
-        return self._execute_read_statement(stmt)
+        return self._execute_read_statement(self._select_all_stmt)
 
     def _select_last_rows(self, n_rows: int) -> list[Any]:
-        stmt = (
-            self._table.select()
-            .order_by(getattr(self._table.c, self._table_config.primary_key).desc())
-            .limit(n_rows)
+        result = self._execute_read_statement(
+            self._select_last_rows_stmt, {"n_rows": n_rows}
         )
-        result = self._execute_read_statement(stmt)
         return result[::-1]
 
+    def _select_max_key(self) -> int | None:
+        with self._engine.connect().execution_options(read_only=True) as connection:
+            return connection.execute(self._select_max_key_stmt).scalar()
+
     def _insert(self, insert_values: dict[str, Any]) -> None:
-        stmt = self._table.insert().values(**insert_values)
-        self._execute_write_statement(stmt)
+        self._execute_write_statement(self._insert_stmt, insert_values)
+
+    def _insert_many(self, insert_values: list[dict[str, Any]]) -> None:
+        # executemany inside one transaction, i.e. a single commit for all rows
+        if insert_values:
+            self._execute_write_statement(self._insert_stmt, insert_values)
 
-    def _execute_read_statement(self, statement: Executable) -> list[Any]:
-        with self._engine.connect() as connection:
-            return connection.execute(statement).fetchall()
+    def _execute_read_statement(
+        self, statement: Executable, parameters: dict[str, Any] | None = None
+    ) -> list[Any]:
+        with self._engine.connect().execution_options(read_only=True) as connection:
+            return connection.execute(statement, parameters).fetchall()
 
-    def _execute_write_statement(self, statement: Executable) -> None:
+    def _execute_write_statement(
+        self,
+        statement: Executable,
+        parameters: dict[str, Any] | list[dict[str, Any]] | None = None,
+    ) -> None:
         try:
             with self._engine.begin() as connection:
-                connection.execute(statement)
+                connection.execute(statement, parameters)
         except (KeyboardInterrupt, SystemExit):
             raise
         except Exception:
@@ -259,6 +306,15 @@ class SQLAlchemySimpleStore(
         """
         self._insert({self._value_column: value})
 
+    def insert_many(self, values: Sequence[InputType]) -> None:
+        """Insert several values into the store in a single transaction.
+
+        Args:
+            values: The values to insert, in order.
+
+        """
+        self._insert_many([{self._value_column: value} for value in values])
+
     def _select_by_key(self, key: int) -> list[OutputType]:
         result = self._select_row_by_key(key)
         return self._post_process(result)
@@ -280,13 +336,28 @@ class SQLAlchemySimpleStore(
         result = self._select_last_rows(n_rows)
         return self._post_process(result)
 
+    def max_key(self) -> int | None:
+        """Get the largest primary key in the store without loading any rows.
+
+        Returns:
+            The largest primary key or None if the store is empty.
+
+        """
+        return self._select_max_key()
+
     def _post_process(self, results: Sequence[sql.Row]) -> list[OutputType]:  # type:ignore
-        output_list = []
-        for row in results:
-            row_dict = {self.primary_key: row[0]}
-            row_dict.update(asdict(row[-1]))
-            output_list.append(self._output_type(**row_dict))
-        return output_list
+        if not results:
+            return []
+        # The unpickled values are fresh objects, so their fields are passed on as is
+        # instead of deep copying them with dataclasses.asdict.
+        field_names = [field.name for field in fields(results[0][-1])]
+        return [
+            self._output_type(
+                **{name: getattr(row[-1], name) for name in field_names},
+                **{self.primary_key: row[0]},
+            )
+            for row in results
+        ]
 
 
 class SQLAlchemyTableStore(
@@ -337,6 +408,15 @@ class SQLAlchemyTableStore(
         """
         self._insert(asdict(value))
 
+    def insert_many(self, values: Sequence[InputType]) -> None:
+        """Insert several values into the store in a single transaction.
+
+        Args:
+            values: The values to insert, in order.
+
+        """
+        self._insert_many([asdict(value) for value in values])
+
     def _update(self, key: int, value: InputType | dict[str, Any]) -> None:
         if not isinstance(value, dict):
             update_values = asdict(value)
@@ -370,6 +450,15 @@ class SQLAlchemyTableStore(
         result = self._select_last_rows(n_rows)
         return self._post_process(result)
 
+    def max_key(self) -> int | None:
+        """Get the largest primary key in the store without loading any rows.
+
+        Returns:
+            The largest primary key or None if the store is empty.
+
+        """
+        return self._select_max_key()
+
     def _post_process(self, results: Sequence[sql.Row]) -> list[OutputType]:  # type:ignore
         return [
             self._output_type(**dict(zip(self.column_names, row, strict=False)))
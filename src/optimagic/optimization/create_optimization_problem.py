@@ -578,16 +578,16 @@ def pre_process_user_algorithm(
 ) -> Algorithm:
     """Process the user specfied algorithm."""
     if isinstance(algorithm, str):
-        try:
-            # Use ALL_ALGORITHMS and not just AVAILABLE_ALGORITHMS such that the
-            # algorithm specific error message with installation instruction will be
-            # reached if an optional dependency is not installed.
-            algorithm = ALL_ALGORITHMS[algorithm]()
-        except KeyError:
+        # Use ALL_ALGORITHMS and not just AVAILABLE_ALGORITHMS such that the
+        # algorithm specific error message with installation instruction will be
+        # reached if an optional dependency is not installed.
+        algo_class = ALL_ALGORITHMS.get(algorithm)
+        if algo_class is None:
             proposed = propose_alternatives(algorithm, list(ALL_ALGORITHMS))
             raise ValueError(
                 f"Invalid algorithm: {algorithm}. Did you mean {proposed}?"
-            ) from None
+            )
+        algorithm = algo_class()
     elif isinstance(algorithm, type) and issubclass(algorithm, Algorithm):
         algorithm = algorithm()
 
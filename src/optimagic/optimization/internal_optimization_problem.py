@@ -79,20 +79,23 @@ class InternalOptimizationProblem:
     # ==================================================================================
 
     def fun(self, x: NDArray[np.float64]) -> float | NDArray[np.float64]:
-        fun_value, hist_entry = self._evaluate_fun(x)
+        fun_value, hist_entry, log_entry = self._evaluate_fun(x)
         self._history.add_entry(hist_entry)
+        self._log_entries([log_entry])
         return fun_value
 
     def jac(self, x: NDArray[np.float64]) -> NDArray[np.float64]:
-        jac_value, hist_entry = self._evaluate_jac(x)
+        jac_value, hist_entry, log_entry = self._evaluate_jac(x)
         self._history.add_entry(hist_entry)
+        self._log_entries([log_entry])
         return jac_value
 
     def fun_and_jac(
         self, x: NDArray[np.float64]
     ) -> tuple[float | NDArray[np.float64], NDArray[np.float64]]:
-        fun_and_jac_value, hist_entry = self._evaluate_fun_and_jac(x)
+        fun_and_jac_value, hist_entry, log_entry = self._evaluate_fun_and_jac(x)
         self._history.add_entry(hist_entry)
+        self._log_entries([log_entry])
         return fun_and_jac_value
 
     def batch_fun(
@@ -112,6 +115,7 @@ class InternalOptimizationProblem:
         fun_values = [result[0] for result in batch_result]
         hist_entries = [result[1] for result in batch_result]
         self._history.add_batch(hist_entries, batch_size)
+        self._log_entries([result[2] for result in batch_result])
 
         return fun_values
 
@@ -133,6 +137,7 @@ class InternalOptimizationProblem:
         jac_values = [result[0] for result in batch_result]
         hist_entries = [result[1] for result in batch_result]
         self._history.add_batch(hist_entries, batch_size)
+        self._log_entries([result[2] for result in batch_result])
         return jac_values
 
     def batch_fun_and_jac(
@@ -152,6 +157,7 @@ class InternalOptimizationProblem:
         fun_and_jac_values = [result[0] for result in batch_result]
         hist_entries = [result[1] for result in batch_result]
         self._history.add_batch(hist_entries, batch_size)
+        self._log_entries([result[2] for result in batch_result])
 
         return fun_and_jac_values
 
@@ -172,6 +178,7 @@ class InternalOptimizationProblem:
         fun_values = [result[0] for result in batch_result]
         hist_entries = [result[1] for result in batch_result]
         self._history.add_batch(hist_entries, batch_size)
+        self._log_entries([result[2] for result in batch_result])
 
         return fun_values
 
@@ -220,23 +227,23 @@ class InternalOptimizationProblem:
 
     # ==================================================================================
     # Implementation of the public functions; The main difference is that the lower-
-    # level implementations return a history entry instead of adding it to the history
-    # directly so they can be called in parallel!
+    # level implementations return a history entry and a log entry instead of adding
+    # them to the history and the logger directly so they can be called in parallel!
     # ==================================================================================
 
-    def _evaluate_fun(
-        self, x: NDArray[np.float64]
-    ) -> tuple[float | NDArray[np.float64], HistoryEntry]:
-        fun_value, hist_entry, log_entry = self._pure_evaluate_fun(x)
-
+    def _log_entries(self, log_entries: list[IterationState]) -> None:
+        # Batches are written in one transaction instead of one commit per evaluation
         if self._logger:
-            self._logger.iteration_store.insert(log_entry)
+            self._logger.iteration_store.insert_many(log_entries)
 
-        return fun_value, hist_entry
+    def _evaluate_fun(
+        self, x: NDArray[np.float64]
+    ) -> tuple[float | NDArray[np.float64], HistoryEntry, IterationState]:
+        return self._pure_evaluate_fun(x)
 
     def _evaluate_jac(
         self, x: NDArray[np.float64]
-    ) -> tuple[NDArray[np.float64], HistoryEntry]:
+    ) -> tuple[NDArray[np.float64], HistoryEntry, IterationState]:
         if self._jac is not None:
             jac_value, hist_entry, log_entry = self._pure_evaluate_jac(x)
         else:
@@ -251,24 +258,20 @@ class InternalOptimizationProblem:
 
             hist_entry = replace(hist_entry, task=EvalTask.JAC)
 
-        if self._logger:
-            self._logger.iteration_store.insert(log_entry)
-
-        return jac_value, hist_entry
+        return jac_value, hist_entry, log_entry
 
     def _evaluate_exploration_fun(
         self, x: NDArray[np.float64]
-    ) -> tuple[float, HistoryEntry]:
-        fun_value, hist_entry, log_entry = self._pure_exploration_fun(x)
-
-        if self._logger:
-            self._logger.iteration_store.insert(log_entry)
-
-        return fun_value, hist_entry
+    ) -> tuple[float, HistoryEntry, IterationState]:
+        return self._pure_exploration_fun(x)
 
     def _evaluate_fun_and_jac(
         self, x: NDArray[np.float64]
-    ) -> tuple[tuple[float | NDArray[np.float64], NDArray[np.float64]], HistoryEntry]:
+    ) -> tuple[
+        tuple[float | NDArray[np.float64], NDArray[np.float64]],
+        HistoryEntry,
+        IterationState,
+    ]:
         if self._fun_and_jac is not None:
             (fun_value, jac_value), hist_entry, log_entry = (
                 self._pure_evaluate_fun_and_jac(x)
@@ -283,10 +286,7 @@ class InternalOptimizationProblem:
                 self._pure_evaluate_numerical_fun_and_jac(x)
             )
 
-        if self._logger:
-            self._logger.iteration_store.insert(log_entry)
-
-        return (fun_value, jac_value), hist_entry
+        return (fun_value, jac_value), hist_entry, log_entry
 
     # ==================================================================================
     # Atomic evaluations of user provided functions or numerical derivatives
@@ -466,15 +466,17 @@ class InternalOptimizationProblem:
         if self._direction == Direction.MAXIMIZE:
             jac_value = -jac_value
 
+        params = self._converter.params_from_internal(x)
+
         hist_entry = HistoryEntry(
-            params=self._converter.params_from_internal(x),
+            params=params,
             fun=hist_fun_value,
             time=now,
             task=EvalTask.FUN_AND_JAC,
         )
 
         log_entry = IterationState(
-            params=self._converter.params_from_internal(x),
+            params=params,
             timestamp=now,
             scalar_fun=hist_fun_value,
             valid=not bool(traceback),
@@ -631,7 +633,15 @@ def _process_fun_value(
 
     """
     algo_value = value.internal_value(solver_type)
-    history_value = cast(float, value.internal_value(AggregationLevel.SCALAR))
+    # Derive the scalar value from the algorithm value where this gives the exact same
+    # result, such that the (possibly pytree) function value is only flattened once.
+    if solver_type == AggregationLevel.SCALAR:
+        history_value = cast(float, algo_value)
+    elif solver_type == AggregationLevel.LEAST_SQUARES:
+        residuals = cast(NDArray[np.float64], algo_value)
+        history_value = float(residuals @ residuals)
+    else:
+        history_value = cast(float, value.internal_value(AggregationLevel.SCALAR))
     if direction == Direction.MAXIMIZE:
         algo_value = -algo_value
 
@@ -22,9 +22,8 @@ def log_scheduled_steps_and_get_ids(
     """
     default_row = {"status": StepStatus.SCHEDULED.value}
     if logger:
-        for row in steps:
-            data = StepResult(**{**default_row, **row})
-            logger.step_store.insert(data)
+        data = [StepResult(**{**default_row, **row}) for row in steps]
+        logger.step_store.insert_many(data)
 
         last_steps = logger.step_store.select_last_rows(len(steps))
         step_ids = cast(list[int], [row.rowid for row in last_steps])
@@ -739,9 +739,10 @@ def _minimize_nlopt(
         opt.set_xtol_rel(convergence_xtol_rel)
     if convergence_xtol_abs is not None:
         opt.set_xtol_abs(convergence_xtol_abs)
-    if problem.bounds.lower is not None:
+    # nlopt's default bounds are -inf and inf, so fully unbounded sides are skipped
+    if problem.bounds.lower is not None and np.isfinite(problem.bounds.lower).any():
         opt.set_lower_bounds(problem.bounds.lower)
-    if problem.bounds.upper is not None:
+    if problem.bounds.upper is not None and np.isfinite(problem.bounds.upper).any():
         opt.set_upper_bounds(problem.bounds.upper)
     if stopping_max_eval is not None:
         opt.set_maxeval(stopping_max_eval)
@@ -757,29 +758,30 @@ def _minimize_nlopt(
     return _process_nlopt_results(opt, solution_x, is_global)
 
 
+_NLOPT_MESSAGES = {
+    1: "Convergence achieved ",
+    2: "Optimizer stopped because maximum value of criterion function was reached",
+    3: (
+        "Optimizer stopped because convergence_ftol_rel or "
+        "convergence_ftol_abs was reached"
+    ),
+    4: (
+        "Optimizer stopped because convergence_xtol_rel or "
+        "convergence_xtol_abs was reached"
+    ),
+    5: "Optimizer stopped because max_criterion_evaluations was reached",
+    6: "Optimizer stopped because max running time was reached",
+    -1: "Optimizer failed",
+    -2: "Invalid arguments were passed",
+    -3: "Memory error",
+    -4: "Halted because roundoff errors limited progress",
+    -5: "Halted because of user specified forced stop",
+}
+
+
 def _process_nlopt_results(nlopt_obj, solution_x, is_global):
-    messages = {
-        1: "Convergence achieved ",
-        2: (
-            "Optimizer stopped because maximum value of criterion function was reached"
-        ),
-        3: (
-            "Optimizer stopped because convergence_ftol_rel or "
-            "convergence_ftol_abs was reached"
-        ),
-        4: (
-            "Optimizer stopped because convergence_xtol_rel or "
-            "convergence_xtol_abs was reached"
-        ),
-        5: "Optimizer stopped because max_criterion_evaluations was reached",
-        6: "Optimizer stopped because max running time was reached",
-        -1: "Optimizer failed",
-        -2: "Invalid arguments were passed",
-        -3: "Memory error",
-        -4: "Halted because roundoff errors limited progress",
-        -5: "Halted because of user specified forced stop",
-    }
-    success = nlopt_obj.last_optimize_result() in [1, 2, 3, 4]
+    result_code = nlopt_obj.last_optimize_result()
+    success = result_code in [1, 2, 3, 4]
     if is_global and not success:
         success = None
     processed = InternalOptimizeResult(
@@ -787,7 +789,7 @@ def _process_nlopt_results(nlopt_obj, solution_x, is_global):
         fun=nlopt_obj.last_optimum_value(),
         n_fun_evals=nlopt_obj.get_numevals(),
         success=success,
-        message=messages[nlopt_obj.last_optimize_result()],
+        message=_NLOPT_MESSAGES[result_code],
     )
 
     return processed
@@ -1,6 +1,5 @@
 """Implement the POUNDERS algorithm."""
 
-import warnings
 from dataclasses import dataclass
 from typing import Any, Literal
 
@@ -355,8 +354,7 @@ def internal_solve_pounders(
         ) - history.get_critvals(-1)
         actual_reduction = -result_sub["criterion"]
 
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", category=RuntimeWarning)
+        with np.errstate(divide="ignore", invalid="ignore"):
             rho = np.divide(predicted_reduction, actual_reduction)
 
         if (rho >= eta1) or (rho > eta0 and valid):
@@ -77,7 +77,7 @@ def _process_nonlinear_constraint(
     # Process selector and evaluate functions if necessary
     # ==================================================================================
 
-    external_selector = _process_selector(c)  # functional selector
+    external_selector = _process_selector(c, params)  # functional selector
 
     constraint_func = c["func"]
 
@@ -294,7 +294,14 @@ def _get_components(fun, jac, idx):
 # ======================================================================================
 
 
-def _process_selector(c):
+def _process_selector(c, params):
+    """Return a function that selects the constrained parameters from params.
+
+    Queries are evaluated once on the start params, such that the returned selector
+    only picks the matching rows by position instead of parsing the query string on
+    each constraint or Jacobian evaluation.
+
+    """
     if "selector" in c:
         selector = c["selector"]
     elif "loc" in c:
@@ -303,9 +310,10 @@ def _process_selector(c):
             return params.loc[c["loc"]]
 
     elif "query" in c:
+        positions = np.flatnonzero(params.eval(c["query"]).to_numpy())
 
         def selector(params):
-            return params.query(c["query"])
+            return params.iloc[positions]
 
     else:
         selector = _identity
@@ -508,7 +516,7 @@ def _check_validity_and_return_evaluation(c, params, skip_checks):
     constraint_eval = None
 
     if not skip_checks:
-        selector = _process_selector(c)
+        selector = _process_selector(c, params)
 
         try:
             constraint_eval = c["func"](selector(params))
@@ -83,8 +83,7 @@ def get_space_converter(
         transformations=transformations,
     )
 
-    _params_from_internal = partial(
-        reparametrize_from_internal,
+    _params_from_internal = _get_params_from_internal(
         fixed_values=constr_info["internal_fixed_values"],
         pre_replacements=constr_info["pre_replacements"],
         transformations=transformations,
@@ -216,20 +215,63 @@ def reparametrize_from_internal(
         numpy.ndarray: Array with external parameters
 
     """
-    # do pre-replacements
-    external_values = pre_replace(internal, fixed_values, pre_replacements)
+    params_from_internal = _get_params_from_internal(
+        fixed_values=fixed_values,
+        pre_replacements=pre_replacements,
+        transformations=transformations,
+        post_replacements=post_replacements,
+    )
+    return params_from_internal(internal)
 
-    # do transformations
-    for constr in transformations:
-        func = getattr(kt, f"{constr['type']}_from_internal")
-        external_values[constr["index"]] = func(
-            external_values[constr["index"]], constr
+
+def _get_params_from_internal(
+    fixed_values,
+    pre_replacements,
+    transformations,
+    post_replacements,
+):
+    """Get a function that does the same as ``reparametrize_from_internal``.
+
+    Everything that only depends on the constraints (the replacement positions and the
+    kernel transformation functions) is computed once here instead of in every call.
+    The arguments are documented in ``reparametrize_from_internal``.
+
+    Returns:
+        callable: Function that maps a 1d array of internal parameters to a 1d array
+            of external parameters.
+
+    """
+    pre_mask = pre_replacements >= 0
+    pre_positions = pre_replacements[pre_mask]
+
+    kernels = [
+        (constr["index"], getattr(kt, f"{constr['type']}_from_internal"), constr)
+        for constr in transformations
+    ]
+
+    post_mask = post_replacements >= 0
+    post_positions = post_replacements[post_mask]
+    has_post_replacements = bool(post_mask.any())
+
+    def params_from_internal(internal):
+        # do pre-replacements
+        external_values = pre_replace(
+            internal, fixed_values, pre_replacements, pre_mask, pre_positions
         )
 
-    # do post-replacements
-    external_values = post_replace(external_values, post_replacements)
+        # do transformations
+        for index, func, constr in kernels:
+            external_values[index] = func(external_values[index], constr)
 
-    return external_values
+        # do post-replacements
+        if has_post_replacements:
+            external_values = post_replace(
+                external_values, post_replacements, post_mask, post_positions
+            )
+
+        return external_values
+
+    return params_from_internal
 
 
 def convert_external_derivative_to_internal(
@@ -348,7 +390,9 @@ def _multiply_from_right(mat_list):
     return out
 
 
-def pre_replace(internal_values, fixed_values, pre_replacements):
+def pre_replace(
+    internal_values, fixed_values, pre_replacements, mask=None, positions=None
+):
     """Return pre-replaced parameters.
 
     Args:
@@ -360,6 +404,8 @@ def pre_replace(internal_values, fixed_values, pre_replacements):
             element in array contains the position of the internal parameter that has to
             be copied to the i_th position of the external parameter vector or -1 if no
             value has to be copied.
+        mask (numpy.ndarray, optional): Precomputed ``pre_replacements >= 0``.
+        positions (numpy.ndarray, optional): Precomputed ``pre_replacements[mask]``.
 
     Returns:
         pre_replaced (numpy.ndarray): 1d numpy array with pre-replaced params.
@@ -376,8 +422,10 @@ def pre_replace(internal_values, fixed_values, pre_replacements):
     """
     pre_replaced = fixed_values.copy()
 
-    mask = pre_replacements >= 0
-    positions = pre_replacements[mask]
+    if mask is None:
+        mask = pre_replacements >= 0
+    if positions is None:
+        positions = pre_replacements[mask]
     pre_replaced[mask] = internal_values[positions]
     return pre_replaced
 
@@ -450,7 +498,7 @@ def transformation_jacobian(transformations, pre_replaced):
     return jacobian
 
 
-def post_replace(external_values, post_replacements):
+def post_replace(external_values, post_replacements, mask=None, positions=None):
     """Return post-replaed parameters.
 
     Args:
@@ -459,6 +507,8 @@ def post_replace(external_values, post_replacements):
             element contains the position a parameter in the transformed parameter
             vector that has to be copied to duplicated and copied to the i_th position
             of the external parameter vector.
+        mask (numpy.ndarray, optional): Precomputed ``post_replacements >= 0``.
+        positions (numpy.ndarray, optional): Precomputed ``post_replacements[mask]``.
 
     Returns:
         post_replaced (numpy.ndarray): 1d numpy array with post-replaced params.
@@ -472,8 +522,10 @@ def post_replace(external_values, post_replacements):
     """
     post_replaced = external_values.copy()
 
-    mask = post_replacements >= 0
-    positions = post_replacements[mask]
+    if mask is None:
+        mask = post_replacements >= 0
+    if positions is None:
+        positions = post_replacements[mask]
     post_replaced[mask] = post_replaced[positions]
     return post_replaced
 
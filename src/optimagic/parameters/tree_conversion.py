@@ -1,6 +1,7 @@
 from typing import Callable, NamedTuple
 
 import numpy as np
+import pandas as pd
 from pybaum import leaf_names, tree_flatten, tree_just_flatten, tree_unflatten
 
 from optimagic.exceptions import InvalidFunctionError
@@ -77,7 +78,7 @@ def get_tree_converter(
 
     _params_flatten = _get_params_flatten(registry=_registry)
     _params_unflatten = _get_params_unflatten(
-        registry=_registry, treedef=_params_treedef
+        registry=_registry, treedef=_params_treedef, params=params
     )
 
     _derivative_flatten = _get_derivative_flatten(
@@ -104,9 +105,20 @@ def _get_params_flatten(registry):
     return params_flatten
 
 
-def _get_params_unflatten(registry, treedef):
-    def params_unflatten(x):
-        return tree_unflatten(treedef=treedef, leaves=list(x), registry=registry)
+def _get_params_unflatten(registry, treedef, params):
+    if isinstance(params, pd.DataFrame):
+        # Call the registry's DataFrame unflatten directly instead of going through
+        # pybaum, which would convert x into a list of scalars and back.
+        _, aux_data = registry[pd.DataFrame]["flatten"](params)
+        unflatten_df = registry[pd.DataFrame]["unflatten"]
+
+        def params_unflatten(x):
+            return unflatten_df(aux_data, x)
+
+    else:
+
+        def params_unflatten(x):
+            return tree_unflatten(treedef=treedef, leaves=list(x), registry=registry)
 
     return params_unflatten
 
@@ -71,7 +71,11 @@ def _unflatten_df(aux_data, leaves, data_col):
 
 
 def _get_df_names(df):
-    index_strings = list(df.index.map(_index_element_to_string))
+    if isinstance(df.index, pd.MultiIndex):
+        index_strings = _multiindex_to_strings(df.index)
+    else:
+        index_strings = list(df.index.map(_index_element_to_string))
+
     if "value" in df:
         out = index_strings
     else:
@@ -88,3 +92,22 @@ def _index_element_to_string(element):
         res_string = str(element)
 
     return res_string
+
+
+def _multiindex_to_strings(index):
+    """Join the entries of each MultiIndex element with underscores.
+
+    Equivalent to mapping ``_index_element_to_string`` over the index, but ``str`` is
+    only called once per unique level value and the joining is vectorized.
+
+    """
+    as_strings = []
+    for i in range(index.nlevels):
+        # keep missing values as uniques, such that they are rendered with their own
+        # representation (e.g. "nan" or "NaT")
+        codes, uniques = pd.factorize(index.get_level_values(i), use_na_sentinel=False)
+        level_strings = np.array(uniques.map(str), dtype=object)
+        as_strings.append(level_strings[codes])
+
+    joined = pd.Series(as_strings[0]).str.cat(as_strings[1:], sep="_")
+    return joined.tolist()
@@ -1,5 +1,5 @@
 import numpy as np
-import plotly.express as px
+import plotly.colors
 import plotly.graph_objects as go
 
 from optimagic.benchmarking.process_benchmark_results import (
@@ -26,7 +26,7 @@ def convergence_plot(
     y_precision=1e-4,
     combine_plots_in_grid=True,
     template=PLOTLY_TEMPLATE,
-    palette=px.colors.qualitative.Plotly,
+    palette=plotly.colors.qualitative.Plotly,
 ):
     """Plot convergence of optimizers for a set of problems.
 
@@ -149,16 +149,17 @@ def convergence_plot(
 
     # creating data traces for plotting faceted/individual plots
     # dropping usage of palette for algoritms, but use the built in pallete
-    for prob_name in remaining_problems:
+    # groupby with sort=False visits groups in order of appearance, like unique(), but
+    # partitions the data in one pass instead of masking it once per group
+    for prob_name, problem_df in df.groupby("problem", sort=False):
         g_ind = []  # container for data for traces in individual plot
-        to_plot = df[df["problem"] == prob_name]
+        to_plot = problem_df
         if runtime_measure == "n_batches":
             to_plot = (
                 to_plot.groupby(["algorithm", runtime_measure]).min().reset_index()
             )
 
-        for i, alg in enumerate(to_plot["algorithm"].unique()):
-            temp = to_plot[to_plot["algorithm"] == alg]
+        for i, (alg, temp) in enumerate(to_plot.groupby("algorithm", sort=False)):
             trace_1 = go.Scatter(
                 x=temp[runtime_measure],
                 y=temp[outcome],
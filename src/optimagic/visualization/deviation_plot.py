@@ -1,10 +1,10 @@
 import pandas as pd
-import plotly.express as px
 
 from optimagic.benchmarking.process_benchmark_results import (
     process_benchmark_results,
 )
 from optimagic.config import PLOTLY_TEMPLATE
+from optimagic.visualization.plotting_utilities import get_plotly_express
 
 
 def deviation_plot(
@@ -76,6 +76,8 @@ def deviation_plot(
         .mean(numeric_only=True)[outcome]
         .reset_index()
     )
+    px = get_plotly_express()
+
     fig = px.line(average_deviations, x=runtime_measure, y=outcome, color="algorithm")
 
     y_labels = {
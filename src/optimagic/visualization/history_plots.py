@@ -1,3 +1,5 @@
+import copy
+import functools
 import itertools
 from pathlib import Path
 
@@ -109,6 +111,8 @@ def criterion_plot(
     # ==================================================================================
     # Plot multistart paths
 
+    traces = []
+
     if plot_multistart:
         scatter_kws = {
             "connectgaps": True,
@@ -131,7 +135,7 @@ def criterion_plot(
                 line_color="#bab0ac",
                 **scatter_kws,
             )
-            fig.add_trace(trace)
+            traces.append(trace)
 
     # ==================================================================================
     # Plot main optimization objects
@@ -169,7 +173,10 @@ def criterion_plot(
             line=line_kws,
             **scatter_kws,
         )
-        fig.add_trace(trace)
+        traces.append(trace)
+
+    # adding all traces at once avoids re-validating the figure data for each trace
+    fig.add_traces(traces)
 
     fig.update_layout(
         template=template,
@@ -230,6 +237,10 @@ def params_plot(
     else:
         history = data["history"].params
 
+    if max_evaluations is not None:
+        # only flatten the parameters that end up in the plot
+        history = history[:max_evaluations]
+
     # ==================================================================================
     # Create figure
     # ==================================================================================
@@ -248,19 +259,17 @@ def params_plot(
         names = [names[i] for i in selected]
         hist_arr = hist_arr[selected]
 
+    traces = []
     for name, data in zip(names, hist_arr, strict=False):
-        if max_evaluations is not None and len(data) > max_evaluations:
-            plot_data = data[:max_evaluations]
-        else:
-            plot_data = data
-
         trace = go.Scatter(
-            x=np.arange(len(plot_data)),
-            y=plot_data,
+            x=np.arange(len(data)),
+            y=data,
             mode="lines",
             name=name,
         )
-        fig.add_trace(trace)
+        traces.append(trace)
+
+    fig.add_traces(traces)
 
     fig.update_layout(
         template=template,
@@ -355,12 +364,7 @@ def _extract_plotting_data_from_database(res, stack_multistart, show_exploration
         are stacked into a single one.
 
     """
-    reader = LogReader.from_options(SQLiteLogOptions(res))
-    _problem_table = reader.problem_df
-
-    direction = _problem_table["direction"].tolist()[-1]
-
-    history, local_histories, exploration = reader.read_multistart_history(direction)
+    direction, history, local_histories, exploration, start_params = _read_database(res)
 
     if stack_multistart and local_histories is not None:
         stacked = _get_stacked_local_histories(local_histories, history)
@@ -376,11 +380,55 @@ def _extract_plotting_data_from_database(res, stack_multistart, show_exploration
         "is_multistart": local_histories is not None,
         "local_histories": local_histories,
         "stacked_local_histories": stacked,
-        "start_params": reader.read_start_params(),
+        "start_params": start_params,
     }
     return data
 
 
+def _get_database_cache_key(path):
+    """Get a key that identifies the current state of the database at path.
+
+    The key consists of the resolved path and the modification times and sizes of the
+    database file and its write-ahead log. Since new iterations of a running
+    optimization are first written to the write-ahead log, both are needed to detect
+    changes. The sizes detect writes that happen within the resolution of the
+    modification times.
+
+    """
+    path = Path(path).resolve()
+    wal_path = path.with_name(f"{path.name}-wal")
+    file_stats = tuple(
+        (p.stat().st_mtime_ns, p.stat().st_size) for p in (path, wal_path) if p.exists()
+    )
+    return str(path), file_stats
+
+
+def _read_database(path):
+    """Read the data needed for plotting from the database at path.
+
+    Reading is cached such that plotting the same database several times (e.g. a
+    criterion plot and a params plot) only reads it once. A copy of the cached data is
+    returned, such that callers cannot modify the cache.
+
+    """
+    return copy.deepcopy(_read_database_cached(*_get_database_cache_key(path)))
+
+
+@functools.lru_cache(maxsize=16)
+def _read_database_cached(path, file_stats):
+    """Read the data needed for plotting from the database at path.
+
+    ``file_stats`` is only used as part of the cache key and invalidates the cache
+    whenever the database changes.
+
+    """
+    reader = LogReader.from_options(SQLiteLogOptions(path))
+    direction = reader.problem_df["direction"].tolist()[-1]
+    history, local_histories, exploration = reader.read_multistart_history(direction)
+    start_params = reader.read_start_params()
+    return direction, history, local_histories, exploration, start_params
+
+
 def _get_stacked_local_histories(local_histories, history=None):
     """Stack local histories.
 
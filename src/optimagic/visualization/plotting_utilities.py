@@ -8,6 +8,18 @@ from plotly.subplots import make_subplots
 from optimagic.config import PLOTLY_TEMPLATE
 
 
+def get_plotly_express():
+    """Import and return plotly.express.
+
+    plotly.express is slow to import and only needed once a plot is created. Importing
+    it lazily keeps it out of the import time of optimagic.
+
+    """
+    import plotly.express as px
+
+    return px
+
+
 def combine_plots(
     plots,
     plots_per_row=2,
@@ -1,11 +1,11 @@
 import numpy as np
 import pandas as pd
-import plotly.express as px
 
 from optimagic.benchmarking.process_benchmark_results import (
     process_benchmark_results,
 )
 from optimagic.config import PLOTLY_TEMPLATE
+from optimagic.visualization.plotting_utilities import get_plotly_express
 
 
 def profile_plot(
@@ -103,6 +103,8 @@ def profile_plot(
     )
     performance_profiles = for_each_alpha.groupby("alpha").mean().stack().reset_index()
 
+    px = get_plotly_express()
+
     fig = px.line(performance_profiles, x="alpha", y=0, color="algorithm")
 
     xlabels = {
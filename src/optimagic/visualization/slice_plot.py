@@ -3,7 +3,6 @@ from functools import partial
 
 import numpy as np
 import pandas as pd
-import plotly.express as px
 from plotly import graph_objects as go
 from pybaum import tree_just_flatten
 
@@ -20,7 +19,11 @@ from optimagic.parameters.conversion import get_converter
 from optimagic.parameters.tree_registry import get_registry
 from optimagic.shared.process_user_function import infer_aggregation_level
 from optimagic.typing import AggregationLevel
-from optimagic.visualization.plotting_utilities import combine_plots, get_layout_kwargs
+from optimagic.visualization.plotting_utilities import (
+    combine_plots,
+    get_layout_kwargs,
+    get_plotly_express,
+)
 
 
 def slice_plot(
@@ -234,6 +237,8 @@ def slice_plot(
         False,
     )
 
+    px = get_plotly_express()
+
     plots_dict = {}
     for pos in selected:
         par_name = internal_params.names[pos]
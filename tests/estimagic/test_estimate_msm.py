@@ -8,7 +8,7 @@ import pytest
 from numpy.testing import assert_array_almost_equal as aaae
 from numpy.testing import assert_array_equal
 
-from estimagic.estimate_msm import estimate_msm
+from estimagic.estimate_msm import estimate_msm, get_msm_optimization_functions
 from optimagic.optimization.optimize_result import OptimizeResult
 from optimagic.shared.check_option_dicts import (
     check_optimization_options,
@@ -201,3 +201,39 @@ def test_caching():
     assert got._cache == {}
     cov = got.cov(method="robust", return_type="array", seed=0)
     assert_array_equal(list(got._cache.values())[0], cov)
+
+
+@pytest.mark.parametrize("simulate_moments", [_sim_pd, _sim_np])
+def test_msm_criterion_with_diagonal_and_full_weights(simulate_moments):
+    empirical_moments = simulate_moments(np.zeros(3))
+    params = np.array([1.0, 2, 3])
+
+    diagonal = get_msm_optimization_functions(
+        simulate_moments, empirical_moments, np.diag([1, 4, 9.0])
+    )["fun"](params)
+    full = get_msm_optimization_functions(
+        simulate_moments,
+        empirical_moments,
+        np.array([[2, 1, 0], [1, 2, 0], [0, 0, 1.0]]),
+    )["fun"](params)
+
+    aaae(diagonal.value, [1, 4, 9])
+    aaae(full.value @ full.value, params @ [[2, 1, 0], [1, 2, 0], [0, 0, 1]] @ params)
+
+
+def test_msm_criterion_with_singular_weights():
+    weights = np.array([[1, 1, 0], [1, 1, 0], [0, 0, 1.0]])
+    params = np.array([1.0, 2, 3])
+    got = get_msm_optimization_functions(_sim_np, np.zeros(3), weights)["fun"](params)
+    aaae(got.value @ got.value, params @ weights @ params)
+
+
+def test_msm_criterion_with_negative_diagonal_weights():
+    with pytest.raises(np.linalg.LinAlgError):
+        get_msm_optimization_functions(_sim_np, np.zeros(3), np.diag([1, -1, 1.0]))
+
+
+def test_msm_criterion_with_indefinite_weights():
+    weights = np.array([[1, 2, 0], [2, 1, 0], [0, 0, 1.0]])
+    with pytest.raises(np.linalg.LinAlgError, match="positive semi-definite"):
+        get_msm_optimization_functions(_sim_np, np.zeros(3), weights)
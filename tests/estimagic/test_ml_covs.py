@@ -74,6 +74,15 @@ def test_clustering(jac, design_options):
     np.allclose(calculated, expected)
 
 
+def test_clustering_with_several_observations_per_cluster():
+    jac = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+    design_info = pd.DataFrame({"psu": ["b", "a", "b"]}, index=[10, 11, 12])
+    calculated = _clustering(jac, design_info)
+    cluster_sums = np.array([[6.0, 8.0], [3.0, 4.0]])
+    expected = 2 * cluster_sums.T @ cluster_sums
+    aaae(calculated, expected)
+
+
 def test_stratification(jac, design_options):
     calculated = _stratification(jac, design_options)
 
@@ -102,6 +111,17 @@ def test_sandwich_step(hess):
     np.allclose(calculated, expected)
 
 
+@pytest.mark.parametrize("scale", [1, 1e-9])
+def test_sandwich_step_with_asymmetric_hessian(scale):
+    hess = np.array([[-2.0, 0.9], [0.1, -1.0]]) * scale
+    meat = np.array([[1.0, 0.2], [0.2, 2.0]])
+    calculated = _sandwich_step(hess, meat=meat)
+
+    inverse = np.linalg.inv(hess)
+    expected = inverse @ meat @ inverse
+    np.testing.assert_allclose(calculated, (expected + expected.T) / 2, rtol=1e-10)
+
+
 def test_cov_robust(jac, hess):
     calculated = cov_robust(jac, hess)
 
@@ -167,6 +187,18 @@ def test_cov_hessian(hess):
     np.allclose(calculated, expected)
 
 
+def test_cov_hessian_with_indefinite_hessian():
+    hess = np.array([[-2.0, 0.5], [0.5, 1.0]])
+    aaae(cov_hessian(hess), np.linalg.inv(-hess))
+
+
+@pytest.mark.parametrize("scale", [1, 1e-9])
+def test_cov_hessian_with_asymmetric_hessian(scale):
+    hess = np.array([[-2.0, 0.9], [0.1, -1.0]]) * scale
+    expected = np.linalg.inv(-hess)
+    np.testing.assert_allclose(cov_hessian(hess), expected, rtol=1e-10)
+
+
 def test_cov_jacobian(jac):
     calculated = cov_jacobian(jac)
     expected = np.array(
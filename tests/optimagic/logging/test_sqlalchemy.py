@@ -1,4 +1,6 @@
+import os
 import pickle
+import sqlite3
 import sys
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
@@ -7,7 +9,7 @@ import pytest
 from sqlalchemy import inspect
 
 from optimagic.logging import ExistenceStrategy
-from optimagic.logging.logger import LogStore, SQLiteLogOptions
+from optimagic.logging.logger import LogStore, SQLiteLogOptions, _SQLiteLogStore
 from optimagic.logging.sqlalchemy import IterationStore, StepStore
 from optimagic.logging.types import (
     IterationState,
@@ -39,6 +41,13 @@ class TestIterationStore:
         """Test that the IterationStore table is created properly."""
         assert store.table_name in inspect(store.engine).get_table_names()
 
+    def test_unrelated_tables_are_not_reflected(self, tmp_path):
+        path = tmp_path / "test.db"
+        with sqlite3.connect(path) as connection:
+            connection.execute("CREATE TABLE other (x INTEGER)")
+        store = IterationStore(SQLiteLogOptions(path))
+        assert list(store._db_config.metadata.tables) == [store.table_name]
+
     def test_insert_and_query(self, store):
         """Test inserting and querying data in the IterationStore."""
         result = self.create_test_point(2456)
@@ -47,6 +56,27 @@ class TestIterationStore:
         assert queried_result is not None
         assert queried_result.scalar_fun == result.scalar_fun
 
+    def test_insert_many(self, store):
+        store.insert_many([self.create_test_point(i) for i in range(3)])
+        assert [row.step for row in store.select()] == [0, 1, 2]
+
+    def test_select_last_rows(self, store):
+        store.insert_many([self.create_test_point(i) for i in range(5)])
+        assert [row.step for row in store.select_last_rows(3)] == [2, 3, 4]
+        assert [row.step for row in store.select_last_rows(10)] == list(range(5))
+
+    def test_select_last_rows_with_gaps_in_keys(self, store):
+        store.insert_many([self.create_test_point(i) for i in range(5)])
+        with store.engine.begin() as connection:
+            connection.execute(store.table.delete().where(store.table.c.rowid == 4))
+        assert [row.step for row in store.select_last_rows(3)] == [1, 2, 4]
+
+    def test_max_key(self, store):
+        assert store.max_key() is None
+        for i in range(3):
+            store.insert(self.create_test_point(i))
+        assert store.max_key() == 3
+
     def test_update_raise(self, store):
         """Test updating an entry in the IterationStore."""
         # Insert initial data
@@ -119,6 +149,16 @@ class TestIterationStore:
                 )
             )
 
+    def test_db_replacement_removes_wal_files(self, store):
+        store.insert(self.create_test_point(245))
+        path = store._db_config.url.split("sqlite:///")[-1]
+        for suffix in ("-wal", "-shm"):
+            with open(f"{path}{suffix}", "wb") as f:
+                f.write(b"stale")
+        _SQLiteLogStore._handle_existing_database(path, ExistenceStrategy.REPLACE)
+        for suffix in ("", "-wal", "-shm"):
+            assert not os.path.exists(f"{path}{suffix}")
+
     def test_db_existence_raise(self, store):
         store.insert(self.create_test_point(245))
         with pytest.raises(FileExistsError):
@@ -153,6 +193,11 @@ class TestStepStore:
         assert queried_result is not None
         assert queried_result.n_iterations == result.n_iterations
 
+    def test_insert_many(self, store):
+        store.insert_many([self.create_test_point(i) for i in range(3)])
+        assert [row.n_iterations for row in store.select()] == [0, 1, 2]
+        assert store.max_key() == 3
+
     def test_insert_string(self, store):
         result = StepResult("strings", "optimization", "running", n_iterations=1)
         store.insert(result)
@@ -8,6 +8,7 @@ from optimagic import NumdiffOptions
 from optimagic.batch_evaluators import process_batch_evaluator
 from optimagic.config import CRITERION_PENALTY_CONSTANT, CRITERION_PENALTY_SLOPE
 from optimagic.exceptions import UserFunctionRuntimeError
+from optimagic.logging.logger import LogStore, SQLiteLogOptions
 from optimagic.optimization.error_penalty import get_error_penalty_function
 from optimagic.optimization.fun_value import (
     LeastSquaresFunctionValue,
@@ -329,6 +330,20 @@ def test_batch_fun_and_jac(base_problem, n_cores):
     aaae(got_jac, expected_jac)
 
 
+@pytest.mark.parametrize("n_cores", [1, 2])
+def test_batch_fun_logs_all_evaluations_in_order(base_problem, n_cores, tmp_path):
+    logger = LogStore.from_options(SQLiteLogOptions(tmp_path / "log.db"))
+    problem = copy(base_problem)
+    problem._logger = logger
+    problem.batch_fun(
+        [np.array([1, 2, 3]), np.array([4, 5, 6]), np.array([7, 8, 9])],
+        n_cores=n_cores,
+    )
+    logged = logger.iteration_store.select()
+    assert [entry.scalar_fun for entry in logged] == [14, 77, 194]
+    aaae(logged[2].params, [7, 8, 9])
+
+
 # ======================================================================================
 # test sign flipping
 # ======================================================================================
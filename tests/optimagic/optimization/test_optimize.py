@@ -44,3 +44,14 @@ def test_with_invalid_numdiff_options():
             algorithm="scipy_lbfgsb",
             numdiff_options={"bla": 15},
         )
+
+
+def test_modifying_result_params_does_not_modify_input_params():
+    params = pd.DataFrame(
+        {"value": [1.0, 2.0], "lower_bound": [-10.0, -10.0]}, index=["a", "b"]
+    )
+    res = minimize(sos_scalar, params=params, algorithm="scipy_lbfgsb")
+    res.params.loc["a", "lower_bound"] = 123
+
+    assert params.loc["a", "lower_bound"] == -10
+    assert params["value"].tolist() == [1.0, 2.0]
@@ -109,7 +109,7 @@ TEST_CASES = [
 
 @pytest.mark.parametrize("constraint, params, expected", TEST_CASES)
 def test_process_selector(constraint, params, expected):
-    _selector = _process_selector(constraint)
+    _selector = _process_selector(constraint, params)
     got = _selector(params)
 
     if isinstance(got, pd.DataFrame):
@@ -118,6 +118,14 @@ def test_process_selector(constraint, params, expected):
         assert got == expected
 
 
+def test_process_selector_query_is_evaluated_on_start_params():
+    params = pd.DataFrame({"value": [1.0, 2.0], "group": ["x", "y"]})
+    _selector = _process_selector({"query": "group == 'y'"}, params)
+    got = _selector(params.assign(value=[3.0, 4.0]))
+    expected = pd.DataFrame({"value": [4.0], "group": ["y"]}, index=[1])
+    assert_frame_equal(got, expected)
+
+
 # ======================================================================================
 # _check_validity_nonlinear_constraint
 # ======================================================================================
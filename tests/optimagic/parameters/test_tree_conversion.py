@@ -93,3 +93,38 @@ def test_tree_conversion_fast_path(solver_type):
     aae(converter.params_flatten(np.arange(3)), np.arange(3))
     aae(converter.params_unflatten(np.arange(3)), np.arange(3))
     aae(converter.derivative_flatten(derivative_eval), derivative_eval)
+
+
+def test_tree_conversion_params_data_frame():
+    params = pd.DataFrame(
+        {"value": [1.0, 2.0], "lower_bound": [0.0, 0.0]}, index=["a", "b"]
+    )
+    converter, flat_params = get_tree_converter(
+        params=params,
+        bounds=None,
+        func_eval=3.0,
+        solver_type=AggregationLevel.SCALAR,
+    )
+
+    aae(flat_params.values, np.array([1.0, 2.0]))
+    aae(flat_params.lower_bounds, np.zeros(2))
+
+    unflat = converter.params_unflatten(np.array([3.0, 4.0]))
+    expected = params.assign(value=[3.0, 4.0])
+    pd.testing.assert_frame_equal(unflat, expected)
+    aae(params["value"].to_numpy(), np.array([1.0, 2.0]))
+
+
+def test_tree_conversion_numeric_data_frame():
+    params = pd.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0]})
+    converter, flat_params = get_tree_converter(
+        params=params,
+        bounds=None,
+        func_eval=3.0,
+        solver_type=AggregationLevel.SCALAR,
+    )
+
+    aae(flat_params.values, np.array([1.0, 3.0, 2.0, 4.0]))
+    unflat = converter.params_unflatten(np.arange(4.0))
+    expected = pd.DataFrame({"a": [0.0, 2.0], "b": [1.0, 3.0]})
+    pd.testing.assert_frame_equal(unflat, expected)
@@ -38,6 +38,15 @@ def test_unflatten_df_with_value_column(value_df):
     assert unflat.equals(value_df.assign(value=[10, 11, 12]))
 
 
+def test_unflatten_df_with_value_column_does_not_modify_template(value_df):
+    registry = get_registry(extended=True)
+    _, treedef = tree_flatten(value_df, registry=registry)
+    tree_unflatten(treedef, [10, 11, 12], registry=registry)
+    unflat = tree_unflatten(treedef, [20, 21, 22], registry=registry)
+    assert value_df["value"].tolist() == [1, 3, 5]
+    assert unflat["value"].tolist() == [20, 21, 22]
+
+
 def test_leaf_names_df_with_value_column(value_df):
     registry = get_registry(extended=True)
     names = leaf_names(value_df, registry=registry)
@@ -62,3 +71,20 @@ def test_leaf_names_partially_numeric_df(other_df):
     registry = get_registry(extended=True)
     names = leaf_names(other_df, registry=registry)
     assert names == ["alpha_b", "alpha_c", "beta_b", "beta_c", "gamma_b", "gamma_c"]
+
+
+def test_leaf_names_df_with_multiindex():
+    index = pd.MultiIndex.from_tuples([("a", 1), ("a", 2), ("b", np.nan)])
+    df = pd.DataFrame({"value": [1.0, 2.0, 3.0]}, index=index)
+    registry = get_registry(extended=True)
+    names = leaf_names(df, registry=registry)
+    assert names == ["a_1.0", "a_2.0", "b_nan"]
+
+
+def test_leaf_names_df_with_multiindex_and_missing_datetime():
+    dates = pd.to_datetime(["2020-01-01", None])
+    index = pd.MultiIndex.from_arrays([["a", "a"], dates])
+    df = pd.DataFrame({"value": [1.0, 2.0]}, index=index)
+    registry = get_registry(extended=True)
+    names = leaf_names(df, registry=registry)
+    assert names == ["a_2020-01-01 00:00:00", "a_NaT"]
@@ -7,7 +7,13 @@ import optimagic as om
 from optimagic.logging import SQLiteLogOptions
 from optimagic.optimization.optimize import minimize
 from optimagic.parameters.bounds import Bounds
-from optimagic.visualization.history_plots import criterion_plot, params_plot
+from optimagic.visualization.history_plots import (
+    _get_database_cache_key,
+    _read_database,
+    _read_database_cached,
+    criterion_plot,
+    params_plot,
+)
 
 
 @pytest.fixture()
@@ -130,3 +136,37 @@ def test_criterion_plot_wrong_inputs():
 
     with pytest.raises(ValueError):
         criterion_plot(["bla", "bla"], names="blub")
+
+
+def test_read_database_is_cached_until_database_changes(tmp_path):
+    path = tmp_path / "log.db"
+    kwargs = {
+        "fun": lambda x: x @ x,
+        "params": np.arange(3),
+        "algorithm": "scipy_lbfgsb",
+    }
+
+    minimize(**kwargs, logging=SQLiteLogOptions(path))
+    first_key = _get_database_cache_key(path)
+    first = _read_database_cached(*first_key)
+    assert _read_database_cached(*_get_database_cache_key(path)) is first
+
+    minimize(**kwargs, logging=SQLiteLogOptions(path, if_database_exists="extend"))
+    assert _get_database_cache_key(path) != first_key
+    assert _read_database_cached(*_get_database_cache_key(path)) is not first
+
+
+def test_read_database_returns_copy_of_cached_data(tmp_path):
+    path = tmp_path / "log.db"
+    minimize(
+        fun=lambda x: x @ x,
+        params=np.arange(3),
+        algorithm="scipy_lbfgsb",
+        logging=SQLiteLogOptions(path),
+    )
+    _, history, *_ = _read_database(path)
+    n_evaluations = len(history["fun"])
+    history["fun"].clear()
+
+    _, history, *_ = _read_database(path)
+    assert len(history["fun"]) == n_evaluations